@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import itertools
 import logging
 import os
@@ -5,6 +7,7 @@ import re
 import math
 
 import c3d
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,25 @@ _HEADER_TYPE_MAP = {
 
 _COORDINATE_LABELS = ['X', 'Y', 'Z']
 
+_UNIT_SCALES = {
+    'mm': 0.001,
+    'cm': 0.01,
+    'm': 1.0,
+}
+# Tolerance for rotation matrices, allowing for values written with six decimal places.
+_ROTATION_TOLERANCE = 1e-6
+# Rotation from a Z-up laboratory frame to the Y-up frame used by OpenSim.
+_Z_UP_TO_Y_UP = [
+    [1.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0],
+    [0.0, -1.0, 0.0],
+]
+
+_NUMBER_BYTES_RE = re.compile(rb'[+-]?((\d+\.?\d*|\.\d+)([eE][+-]?\d+)?|nan|inf|infinity)', re.IGNORECASE)
+
+_ASYNC_CHUNK_SIZE = 1000
+_ASYNC_MAX_CONCURRENCY = 4
+
 
 class TRCFormatError(Exception):
     pass
@@ -39,6 +61,19 @@ def _convert_coordinates(coordinates):
     return [_convert_to_number(value) for value in coordinates]
 
 
+def _format_data_line(frame, time, line_data, format_adjustment):
+    values = ['' if math.isnan(v) else f'{v:.5f}' for values in line_data for v in values]
+    numeric_values = '\t'.join(values)
+    return f'{frame}\t{time:.3f}\t{numeric_values}{format_adjustment}{os.linesep}'
+
+
+def _read_lines(filename, encoding, errors):
+    with open(filename, 'rb') as f:
+        contents = f.read().decode(encoding=encoding, errors=errors)
+
+    return contents.split(os.linesep)
+
+
 class TRCData(dict):
     """
     A trc data object when populated via 'load' or 'parse' contains motion capture data.
@@ -58,11 +93,45 @@ class TRCData(dict):
         for index, marker_data in enumerate(data):
             self[markers[index]] += [marker_data]
 
-    def _process_contents(self, contents, verbose):
-        lines_iter = iter(contents)
+    def _data_format_count(self):
+        return len(self['DataFormat'].split('/'))
+
+    def _coordinate_array(self):
+        """
+        Get the marker coordinates for all frames as a single array.
+
+        :return: An array with shape (frames, markers, coordinates).
+        """
+        coordinates = np.array([self[frame][1] for frame in self['Frame#']], dtype=float)
+        return coordinates.reshape(len(self['Frame#']), int(self['NumMarkers']), self._data_format_count())
+
+    def _frame_times(self):
+        return np.array([self[frame][0] for frame in self['Frame#']], dtype=float)
+
+    def _marker_pairs(self, pairs):
+        marker_indices = {marker: index for index, marker in enumerate(self['Markers'])}
+        if pairs is None:
+            pairs = itertools.combinations(self['Markers'], 2)
+        pairs = list(pairs)
+
+        for marker in set(itertools.chain.from_iterable(pairs)):
+            if marker not in marker_indices:
+                raise KeyError(f'Could not find marker: {marker}')
+
+        first = [marker_indices[pair[0]] for pair in pairs]
+        second = [marker_indices[pair[1]] for pair in pairs]
+        return [tuple(pair) for pair in pairs], first, second
+
+    def _process_header(self, lines_iter):
+        """
+        Process the header lines from the lines iterator.
+
+        :param lines_iter: An iterator over the lines of the trc data.
+        :return: A tuple of the lines iterator positioned at the first data line, the current line number,
+            the marker names and the data format count.
+        """
         current_line_num = 0
 
-        # Process file header.
         try:
             current_line_num += 1
             sections = next(lines_iter).split(maxsplit=3)
@@ -127,52 +196,75 @@ class TRCData(dict):
         except StopIteration:
             raise TRCFormatError(f"File ended unexpectedly at line {current_line_num} during header parsing.")
 
-        for line in lines_iter:
+        return lines_iter, current_line_num, marker_names, data_format_count
+
+    def _parse_data_line(self, line, current_line_num, data_format_count, verbose):
+        """
+        Parse a single data line.
+
+        :return: A tuple of frame number, time and marker coordinates, or None if the line is blank.
+        """
+        sections = line.split()
+        if len(sections) == 0:
+            return None
+
+        # Parse Frame
+        try:
+            frame = int(sections.pop(0))
+        except ValueError:
+            raise TRCFormatError(f"File format invalid: Invalid frame number at line {current_line_num}.")
+
+        # Parse Time
+        try:
+            time = float(sections.pop(0))
+        except IndexError:
+            raise TRCFormatError(f"Missing time value at line {current_line_num}")
+        except ValueError:
+            raise TRCFormatError(f"Invalid time value at line {current_line_num}")
+
+        line_data = [[float('nan')] * data_format_count for _ in range(int(self['NumMarkers']))]
+        len_section = len(sections)
+        expected_entries = len(line_data) * data_format_count
+        if len_section > expected_entries:
+            if verbose:
+                logger.warning(
+                    f'Bad data line, frame: {frame}, time: {time}, expected entries: {expected_entries},'
+                    f' actual entries: {len_section}')
+        elif len_section % data_format_count == 0:
+            for index, place in enumerate(range(0, len_section, data_format_count)):
+                coordinates = _convert_coordinates(sections[place:place + data_format_count])
+                line_data[index] = coordinates
+        else:
+            raise TRCFormatError(
+                'File format invalid: Data frame %d does not match the data format' % len_section)
+
+        return frame, time, line_data
+
+    def _process_data_lines(self, lines, current_line_num, marker_names, data_format_count, verbose):
+        """
+        Process data lines, adding each parsed frame to this object.
+
+        :return: The line number of the last line processed and a list of the frames added.
+        """
+        frames = []
+        for line in lines:
             current_line_num += 1
-            sections = line.split()
-            if len(sections) == 0:
+            parsed = self._parse_data_line(line, current_line_num, data_format_count, verbose)
+            if parsed is None:
                 continue
 
-            # Parse Frame
-            try:
-                frame = int(sections.pop(0))
-                self['Frame#'].append(frame)
-            except ValueError:
-                raise TRCFormatError(
-                    f"File format invalid: "
-                    f"Data frame length is {len(self['Frame#'])}, "
-                    f"Expected {self['NumFrames']} frames."
-                )
+            frame, time, line_data = parsed
+            self['Frame#'].append(frame)
+            self['Time'].append(time)
+            self[frame] = (time, line_data)
+            self._append_per_label_data(marker_names, line_data)
+            frames.append(frame)
 
-            # Parse Time
-            try:
-                time = float(sections.pop(0))
-                self['Time'].append(time)
-            except IndexError:
-                raise TRCFormatError(f"Missing time value at line {current_line_num}")
-            except ValueError:
-                raise TRCFormatError(f"Invalid time value at line {current_line_num}")
-
-            line_data = [[float('nan')] * data_format_count for _ in range(int(self['NumMarkers']))]
-            len_section = len(sections)
-            expected_entries = len(line_data) * data_format_count
-            if len_section > expected_entries:
-                if verbose:
-                    logger.warning(
-                        f'Bad data line, frame: {frame}, time: {time}, expected entries: {expected_entries},'
-                        f' actual entries: {len_section}')
-                self[frame] = (time, line_data)
-                self._append_per_label_data(marker_names, line_data)
-            elif len_section % data_format_count == 0:
-                for index, place in enumerate(range(0, len_section, data_format_count)):
-                    coordinates = _convert_coordinates(sections[place:place + data_format_count])
-                    line_data[index] = coordinates
-
-                self[frame] = (time, line_data)
-                self._append_per_label_data(marker_names, line_data)
-            else:
-                raise TRCFormatError(
-                    'File format invalid: Data frame %d does not match the data format' % len_section)
+        return current_line_num, frames
+
+    def _process_contents(self, contents, verbose):
+        lines_iter, current_line_num, marker_names, data_format_count = self._process_header(iter(contents))
+        self._process_data_lines(lines_iter, current_line_num, marker_names, data_format_count, verbose)
 
     def parse(self, data, line_sep=os.linesep, verbose=False):
         """
@@ -197,12 +289,404 @@ class TRCData(dict):
         :param errors: Default error handling is 'strict',see https://docs.python.org/3/library/codecs.html#error-handlers.
         :param verbose: Boolean for having verbose output, default is False.
         """
-        with open(filename, 'rb') as f:
-            contents = f.read().decode(encoding=encoding, errors=errors)
-
-        contents = contents.split(os.linesep)
+        contents = _read_lines(filename, encoding, errors)
         self._process_contents(contents, verbose)
 
+    async def iter_frames_async(self, filename, encoding="utf-8", errors="strict", verbose=False,
+                                chunk_size=_ASYNC_CHUNK_SIZE, executor=None):
+        """
+        Asynchronously load a trc motion capture data file, yielding each frame as it is parsed.
+        The file is read and parsed in an executor, chunk_size data lines at a time, so that the
+        event loop is not blocked.  Cancelling the consumer stops parsing at the next chunk boundary.
+
+        Yields tuples of (frame, (time, marker_list)), the same values available from this object
+        by frame number once loading is complete.
+
+        :param filename: The name of the file to load.
+        :param encoding: Default encoding is 'utf-8', see https://docs.python.org/3/library/codecs.html#standard-encodings.
+        :param errors: Default error handling is 'strict',see https://docs.python.org/3/library/codecs.html#error-handlers.
+        :param verbose: Boolean for having verbose output, default is False.
+        :param chunk_size: The number of data lines to parse in the executor at a time [default: 1000].
+        :param executor: The executor to parse with, default is None which uses the loop's default executor.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'Chunk size must be at least one line, not {chunk_size}.')
+
+        loop = asyncio.get_running_loop()
+        contents = await loop.run_in_executor(executor, _read_lines, filename, encoding, errors)
+        lines_iter, current_line_num, marker_names, data_format_count = await loop.run_in_executor(
+            executor, self._process_header, iter(contents))
+
+        while True:
+            chunk = list(itertools.islice(lines_iter, chunk_size))
+            if not chunk:
+                break
+
+            current_line_num, frames = await loop.run_in_executor(
+                executor, self._process_data_lines, chunk, current_line_num, marker_names, data_format_count, verbose)
+            for frame in frames:
+                yield frame, self[frame]
+
+    async def load_async(self, filename, encoding="utf-8", errors="strict", verbose=False,
+                         chunk_size=_ASYNC_CHUNK_SIZE, executor=None):
+        """
+        Asynchronously load a trc motion capture data file into a dictionary like object.
+        See 'iter_frames_async' for a description of the parameters.
+
+        :param filename: The name of the file to load.
+        """
+        async for _ in self.iter_frames_async(filename, encoding, errors, verbose, chunk_size, executor):
+            pass
+
+    def _iter_chunks(self, lines_iter, current_line_num, data_format_count, func, chunk_size, overlap, verbose):
+        def _rows():
+            line_num = current_line_num
+            for line in lines_iter:
+                line_num += 1
+                parsed = self._parse_data_line(line, line_num, data_format_count, verbose)
+                if parsed is not None:
+                    yield parsed
+
+        rows = _rows()
+        marker_count = int(self['NumMarkers'])
+        buffer = []
+        start = 0
+        exhausted = False
+        while True:
+            if not exhausted:
+                wanted = start + chunk_size + overlap - len(buffer)
+                new_rows = list(itertools.islice(rows, wanted))
+                exhausted = len(new_rows) < wanted
+                buffer.extend(new_rows)
+
+            stop = min(start + chunk_size, len(buffer))
+            if start >= stop:
+                break
+
+            frames = np.array([row[0] for row in buffer], dtype=int)
+            times = np.array([row[1] for row in buffer], dtype=float)
+            coordinates = np.array([row[2] for row in buffer], dtype=float).reshape(
+                len(buffer), marker_count, data_format_count)
+            core = slice(start, stop)
+            yield frames[core], times[core], func(frames, times, coordinates, core)
+
+            # Keep the trailing frames of this chunk as the leading halo of the next chunk.
+            keep_from = max(0, stop - overlap)
+            buffer = buffer[keep_from:]
+            start = stop - keep_from
+
+    def map_chunks(self, filename, func, chunk_size=10000, overlap=0, reduce=None, initial=None, output=None,
+                   add_trailing_tab=False, encoding="utf-8", errors="strict", verbose=False):
+        """
+        Apply a function to fixed size chunks of frames read from a trc motion capture data file.
+        Only chunk_size frames, plus overlap frames either side, are held in memory at a time.
+        This object is populated with the header of the file, the frame data is not stored.
+
+        The function is called as func(frames, times, coordinates, core) where frames and times are
+        arrays with one entry per frame in the chunk, coordinates is an array with shape
+        (frames, markers, coordinates) and core is a slice selecting the frames belonging to this
+        chunk, the remaining frames are halo frames from the neighbouring chunks.
+
+        When output is given the function must return the coordinates for the core frames, with shape
+        (core frames, markers, coordinates), these are written to the output file as they are
+        calculated and nothing is returned.  Otherwise the results of the function are returned as
+        a list, or combined with reduce when it is given.
+
+        :param filename: The name of the file to read.
+        :param func: The function to apply to each chunk.
+        :param chunk_size: The number of frames in each chunk [default: 10000].
+        :param overlap: The number of halo frames to include before and after each chunk [default: 0].
+        :param reduce: Optional; A function of two arguments used to combine the chunk results, as for functools.reduce.
+        :param initial: Optional; The initial value for reduce.
+        :param output: Optional; String or pathlike to write the transformed frames to.
+        :param add_trailing_tab: Add a trailing tab to the header and data lines of the output [default: False].
+        :param encoding: Default encoding is 'utf-8', see https://docs.python.org/3/library/codecs.html#standard-encodings.
+        :param errors: Default error handling is 'strict',see https://docs.python.org/3/library/codecs.html#error-handlers.
+        :param verbose: Boolean for having verbose output, default is False.
+        :return: The list of results, the reduced result, or None when output is given.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'Chunk size must be at least one frame, not {chunk_size}.')
+        if overlap < 0:
+            raise ValueError(f'Overlap must not be negative, not {overlap}.')
+
+        with open(filename, 'r', encoding=encoding, errors=errors) as f:
+            lines = (line.rstrip('\n') for line in f)
+            lines_iter, current_line_num, _, data_format_count = self._process_header(lines)
+            chunks = self._iter_chunks(
+                lines_iter, current_line_num, data_format_count, func, chunk_size, overlap, verbose)
+
+            if output is not None:
+                header = self._format_header(add_trailing_tab)
+                format_adjustment = '\t' if add_trailing_tab else ''
+                with open(output, 'w', newline='') as out:
+                    out.write(header)
+                    for frames, times, coordinates in chunks:
+                        expected_shape = (len(frames), int(self['NumMarkers']), data_format_count)
+                        if np.shape(coordinates) != expected_shape:
+                            raise ValueError(f'Chunk function returned coordinates with shape {np.shape(coordinates)}, '
+                                             f'expected {expected_shape}.')
+                        for frame, time, line_data in zip(frames.tolist(), times.tolist(),
+                                                          np.asarray(coordinates).tolist()):
+                            out.write(_format_data_line(frame, time, line_data, format_adjustment))
+                return None
+
+            results = (result for _, _, result in chunks)
+            if reduce is None:
+                return list(results)
+            if initial is None:
+                return functools.reduce(reduce, results)
+            return functools.reduce(reduce, results, initial)
+
+    def velocities(self, use_time=False):
+        """
+        Calculate the velocity of every marker at every frame using finite differences.
+        Central differences are used for interior frames and one-sided differences for the first
+        and last frames.  Missing coordinates result in NaN velocities for the neighbouring frames.
+
+        :param use_time: Use the 'Time' of each frame for the frame spacing instead of 'DataRate' [default: False].
+        :return: An array with shape (frames, markers, coordinates), markers are in the order given by 'Markers'.
+        """
+        return self._differentiate(self._coordinate_array(), use_time)
+
+    def accelerations(self, use_time=False):
+        """
+        Calculate the acceleration of every marker at every frame using finite differences.
+        The acceleration is the finite difference of the velocities, see 'velocities'.
+
+        :param use_time: Use the 'Time' of each frame for the frame spacing instead of 'DataRate' [default: False].
+        :return: An array with shape (frames, markers, coordinates), markers are in the order given by 'Markers'.
+        """
+        return self._differentiate(self.velocities(use_time), use_time)
+
+    def _differentiate(self, values, use_time):
+        if len(values) < 2:
+            raise ValueError('At least two frames are required to calculate finite differences.')
+
+        spacing = self._frame_times() if use_time else 1.0 / float(self['DataRate'])
+        return np.gradient(values, spacing, axis=0)
+
+    def _pair_distances(self, pairs):
+        pairs, first, second = self._marker_pairs(pairs)
+        coordinates = self._coordinate_array()
+        return pairs, np.linalg.norm(coordinates[:, first, :] - coordinates[:, second, :], axis=2)
+
+    def marker_distances(self, pairs=None):
+        """
+        Calculate the distance between pairs of markers at every frame.
+        The distance for a frame is NaN when either marker is missing from that frame.
+
+        :param pairs: Optional; A list of (marker, marker) pairs, default is every pair of markers.
+        :return: A dictionary mapping each pair to an array of distances with one entry per frame.
+        """
+        pairs, distances = self._pair_distances(pairs)
+        return {pair: distances[:, index] for index, pair in enumerate(pairs)}
+
+    def segment_lengths(self, pairs=None):
+        """
+        Calculate the mean length of segments defined by pairs of markers over all frames.
+        Frames where either marker is missing are ignored, a segment with no valid frames has a length of NaN.
+
+        :param pairs: Optional; A list of (marker, marker) pairs, default is every pair of markers.
+        :return: A dictionary mapping each pair to the mean distance between the markers.
+        """
+        pairs, distances = self._pair_distances(pairs)
+        valid_counts = np.sum(~np.isnan(distances), axis=0)
+        totals = np.nansum(distances, axis=0)
+        lengths = np.divide(totals, valid_counts, out=np.full(len(pairs), np.nan), where=valid_counts > 0)
+        return {pair: float(lengths[index]) for index, pair in enumerate(pairs)}
+
+    def _update_coordinates(self, coordinates):
+        """
+        Update the marker coordinates in place from an array with shape (frames, markers, coordinates).
+        The coordinate lists are modified rather than replaced so the per frame and per marker
+        data remain shared.
+        """
+        line_data_list = (self[frame][1] for frame in self['Frame#'])
+        for line_data, new_line_data in zip(line_data_list, coordinates.tolist()):
+            for values, new_values in zip(line_data, new_line_data):
+                values[:] = new_values
+
+    def convert_units(self, units):
+        """
+        Convert the marker coordinates to the given units, updating 'Units'.
+        Supported units are 'mm', 'cm' and 'm'.
+
+        :param units: The units to convert to.
+        """
+        current_units = str(self['Units']).strip()
+        for unit in [current_units, units]:
+            if unit not in _UNIT_SCALES:
+                raise ValueError(f"Unsupported units '{unit}', expected one of {list(_UNIT_SCALES.keys())}.")
+
+        if current_units != units:
+            coordinates = self._coordinate_array()
+            coordinates *= _UNIT_SCALES[current_units] / _UNIT_SCALES[units]
+            self._update_coordinates(coordinates)
+        self['Units'] = units
+
+    def transform(self, rotation=None, translation=None):
+        """
+        Apply a rigid transformation to the marker coordinates of every frame.
+        The rotation is applied first, then the translation.  Missing coordinates remain missing.
+
+        :param rotation: Optional; A 3x3 rotation matrix, orthonormal with a determinant of one,
+            applied as rotation @ coordinates.
+        :param translation: Optional; A translation vector with an entry for each coordinate.
+        """
+        coordinates = self._coordinate_array()
+        if rotation is not None:
+            rotation = np.asarray(rotation, dtype=float)
+            if rotation.shape != (coordinates.shape[2], coordinates.shape[2]):
+                raise ValueError(f'Rotation shape {rotation.shape} does not match the data format '
+                                 f"{self['DataFormat']}.")
+            if not np.allclose(rotation @ rotation.T, np.eye(len(rotation)), rtol=0.0, atol=_ROTATION_TOLERANCE):
+                raise ValueError('Rotation must be an orthonormal matrix.')
+            # An orthonormal matrix has a determinant of plus or minus one, minus one is a reflection.
+            if np.linalg.det(rotation) < 0:
+                raise ValueError('Rotation must not be a reflection, use mirror for reflections.')
+            coordinates = coordinates @ rotation.T
+        if translation is not None:
+            translation = np.asarray(translation, dtype=float)
+            if translation.shape != (coordinates.shape[2],):
+                raise ValueError(f'Translation shape {translation.shape} does not match the data format '
+                                 f"{self['DataFormat']}.")
+            coordinates += translation
+
+        self._update_coordinates(coordinates)
+
+    def z_up_to_y_up(self):
+        """
+        Rotate the marker coordinates from a Z-up laboratory frame to the Y-up frame used by OpenSim.
+        """
+        self.transform(rotation=_Z_UP_TO_Y_UP)
+
+    def mirror(self, axis):
+        """
+        Mirror the marker coordinates by negating the coordinate for the given axis.
+
+        :param axis: The axis to mirror, one of the labels of the data format, e.g. 'X', 'Y' or 'Z'.
+        """
+        axis_labels = _COORDINATE_LABELS[:self._data_format_count()]
+        if axis not in axis_labels:
+            raise ValueError(f"Unknown axis '{axis}', expected one of {axis_labels}.")
+
+        coordinates = self._coordinate_array()
+        coordinates[:, :, axis_labels.index(axis)] *= -1
+        self._update_coordinates(coordinates)
+
+    def _header_items(self):
+        excluded = set(self['Markers']) | {'Frame#', 'Time', 'Markers'}
+        return {key: value for key, value in self.items() if isinstance(key, str) and key not in excluded}
+
+    def _populate_frames(self, frames, times, coordinates):
+        """
+        Populate the frame and marker data from arrays of frame numbers, times and coordinates.
+        The 'Markers' key must already be set to the markers of the coordinates.
+        """
+        frames = [int(frame) for frame in frames]
+        times = [float(time) for time in times]
+        coordinates = np.asarray(coordinates).tolist()
+
+        self['Frame#'] = frames
+        self['Time'] = times
+        self['NumFrames'] = len(frames)
+        self['NumMarkers'] = len(self['Markers'])
+        for frame, time, line_data in zip(frames, times, coordinates):
+            self[frame] = (time, line_data)
+        for index, marker in enumerate(self['Markers']):
+            self[marker] = [line_data[index] for line_data in coordinates]
+
+    def _check_compatible(self, other):
+        if float(self['DataRate']) != float(other['DataRate']):
+            raise ValueError(f"Data rate mismatch: {self['DataRate']} != {other['DataRate']}.")
+        if str(self['Units']).strip() != str(other['Units']).strip():
+            raise ValueError(f"Units mismatch: {self['Units']} != {other['Units']}.")
+        if self._data_format_count() != other._data_format_count():
+            raise ValueError(f"Data format mismatch: {self['DataFormat']} != {other['DataFormat']}.")
+
+    @classmethod
+    def concat(cls, trials):
+        """
+        Concatenate the frames of consecutive trials into a new TRCData object.
+        All trials must have the same markers, data rate, units and data format.  The header is
+        taken from the first trial, the frames are renumbered to follow on from the first frame
+        of the first trial and the times are recalculated from the data rate.
+
+        :param trials: A list of TRCData objects to concatenate, in order.
+        :return: A new TRCData object.
+        """
+        if not trials:
+            raise ValueError('At least one trial is required to concatenate.')
+
+        first = trials[0]
+        markers = first['Markers']
+        blocks = []
+        for trial in trials:
+            first._check_compatible(trial)
+            if sorted(trial['Markers']) != sorted(markers):
+                raise ValueError(f"Markers mismatch: {trial['Markers']} != {markers}.")
+            order = [trial['Markers'].index(marker) for marker in markers]
+            blocks.append(trial._coordinate_array()[:, order, :])
+
+        coordinates = np.concatenate(blocks, axis=0)
+        frame_count = len(coordinates)
+        first_frame = first['Frame#'][0] if first['Frame#'] else 1
+        first_time = first[first_frame][0] if first['Frame#'] else 0.0
+
+        result = cls()
+        result.update(first._header_items())
+        result['Markers'] = list(markers)
+        result._populate_frames(first_frame + np.arange(frame_count),
+                                first_time + np.arange(frame_count) / float(first['DataRate']),
+                                coordinates)
+        return result
+
+    def merge(self, other, on='Time'):
+        """
+        Merge the markers of another trial recorded at the same rate into a new TRCData object.
+        Frames are aligned on either the frame number or the time, only frames present in both
+        trials are kept.  Times are aligned to the nearest frame of the data rate, two frames aligned
+        to the same frame number or time raise a ValueError.  The trials must
+        have the same data rate, units and data format, and must not share any markers.
+
+        :param other: The TRCData object to merge with.
+        :param on: Align frames on 'Time' or 'Frame#' [default: 'Time'].
+        :return: A new TRCData object with the header of this object and the markers of both.
+        """
+        self._check_compatible(other)
+        shared_markers = set(self['Markers']) & set(other['Markers'])
+        if shared_markers:
+            raise ValueError(f'Markers present in both trials: {sorted(shared_markers)}.')
+
+        if on == 'Frame#':
+            keys = np.array(self['Frame#'], dtype=int)
+            other_keys = np.array(other['Frame#'], dtype=int)
+        elif on == 'Time':
+            keys = np.rint(self._frame_times() * float(self['DataRate'])).astype(int)
+            other_keys = np.rint(other._frame_times() * float(other['DataRate'])).astype(int)
+        else:
+            raise ValueError(f"Can only merge on 'Time' or 'Frame#', not '{on}'.")
+
+        for trial, trial_keys in [(self, keys), (other, other_keys)]:
+            unique_keys, counts = np.unique(trial_keys, return_counts=True)
+            duplicates = unique_keys[counts > 1]
+            if len(duplicates):
+                if on == 'Time':
+                    duplicates = duplicates / float(trial['DataRate'])
+                raise ValueError(f"Duplicate {on} values in trial {trial.get('FileName', '')}: "
+                                 f'{duplicates.tolist()}.')
+
+        _, indices, other_indices = np.intersect1d(keys, other_keys, return_indices=True)
+        coordinates = np.concatenate(
+            [self._coordinate_array()[indices], other._coordinate_array()[other_indices]], axis=1)
+
+        result = type(self)()
+        result.update(self._header_items())
+        result['Markers'] = self['Markers'] + other['Markers']
+        result._populate_frames(np.array(self['Frame#'])[indices], self._frame_times()[indices], coordinates)
+        return result
+
     def _import_from_c3d(self, filename, filter_output=None, label_params=None):
         """
         Extracts TRC data from a C3D file.
@@ -281,14 +765,19 @@ class TRCData(dict):
         """
         self._import_from_c3d(filename, *args, **kwargs)
 
-    def save(self, filename, add_trailing_tab=False):
+    async def import_from_async(self, filename, *args, executor=None, **kwargs):
         """
-        Save TRC motion capture data to a file specified by filename.
-        To work with OpenSIM and Mokka formats set the add trailing tab parameter to True.
+        Asynchronously import data from a non-TRC file source.
+        The import is run in an executor so that the event loop is not blocked, see 'import_from'
+        for the accepted arguments.
 
-        :param filename: String or pathlike to write to.
-        :param add_trailing_tab: Add a trailing tab to the header and data lines [default: False].
+        :param filename: The source file of the data to be imported.
+        :param executor: The executor to import with, default is None which uses the loop's default executor.
         """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, functools.partial(self.import_from, filename, *args, **kwargs))
+
+    def _format_header(self, add_trailing_tab):
         if 'PathFileType' in self:
             header_line_1 = f"PathFileType\t{self['PathFileType']}\t{self['DataFormat']}\t{self['FileName']}{os.linesep}"
         else:
@@ -299,7 +788,7 @@ class TRCData(dict):
             if header_key not in self:
                 raise KeyError(f'Could not find required header key: {header_key}')
 
-        data_format_count = len(self['DataFormat'].split('/'))
+        data_format_count = self._data_format_count()
 
         keys_to_write = [k for k in _HEADER_TYPE_MAP.keys()]
         header_line_2 = '\t'.join(keys_to_write) + '\n'
@@ -316,19 +805,169 @@ class TRCData(dict):
 
         blank_line = os.linesep
 
-        with open(filename, 'w', newline='') as f:
+        return header_line_1 + header_line_2 + header_line_3 + data_header_line_1 + data_header_line_2 + blank_line
 
-            f.write(header_line_1)
-            f.write(header_line_2)
-            f.write(header_line_3)
+    def save(self, filename, add_trailing_tab=False):
+        """
+        Save TRC motion capture data to a file specified by filename.
+        To work with OpenSIM and Mokka formats set the add trailing tab parameter to True.
 
-            f.write(data_header_line_1)
-            f.write(data_header_line_2)
+        :param filename: String or pathlike to write to.
+        :param add_trailing_tab: Add a trailing tab to the header and data lines [default: False].
+        """
+        header = self._format_header(add_trailing_tab)
+        format_adjustment = '\t' if add_trailing_tab else ''
+
+        with open(filename, 'w', newline='') as f:
 
-            f.write(blank_line)
+            f.write(header)
 
             for frame in self['Frame#']:
                 time, line_data = self[frame]
-                values = ['' if math.isnan(v) else f'{v:.5f}' for values in line_data for v in values]
-                numeric_values = '\t'.join(values)
-                f.write(f'{frame}\t{time:.3f}\t{numeric_values}{format_adjustment}{os.linesep}')
+                f.write(_format_data_line(frame, time, line_data, format_adjustment))
+
+
+async def load_many_async(filenames, max_concurrency=_ASYNC_MAX_CONCURRENCY, executor=None,
+                          load_kwargs=None, import_kwargs=None):
+    """
+    Asynchronously load many motion capture data files, at most max_concurrency at a time.
+    Files with a '.c3d' extension are imported with 'import_from_async', all other files are
+    loaded with 'load_async'.
+
+    :param filenames: The names of the files to load.
+    :param max_concurrency: The maximum number of files to load at the same time [default: 4].
+    :param executor: The executor to load with, default is None which uses the loop's default executor.
+    :param load_kwargs: Optional; A dictionary of keyword arguments passed on to 'load_async'.
+    :param import_kwargs: Optional; A dictionary of keyword arguments passed on to 'import_from_async'.
+    :return: A list of TRCData objects in the same order as filenames.
+    """
+    load_kwargs = {} if load_kwargs is None else load_kwargs
+    import_kwargs = {} if import_kwargs is None else import_kwargs
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _load(filename):
+        async with semaphore:
+            data = TRCData()
+            if os.path.splitext(filename)[1].lower() == '.c3d':
+                await data.import_from_async(filename, executor=executor, **import_kwargs)
+            else:
+                await data.load_async(filename, executor=executor, **load_kwargs)
+            return data
+
+    return await asyncio.gather(*[_load(filename) for filename in filenames])
+
+
+def _validate_header(header_lines, problems):
+    """
+    Validate the five header lines of trc data given as bytes.
+
+    :return: A tuple of the expected number of frames, the expected number of entries per data line
+        and the data format count, values that could not be determined are None.
+    """
+    num_frames = None
+    num_markers = None
+    data_format_count = None
+
+    sections = header_lines[0].split(maxsplit=3)
+    if len(sections) != 4:
+        problems.append((1, 'Header line 1 does not have four space delimited sections.'))
+    if len(sections) > 2:
+        data_format_count = len(sections[2].split(b'/'))
+
+    header_keys = header_lines[1].split()
+    header_values = header_lines[2].split()
+    decoded_keys = [key.decode(errors='replace') for key in header_keys]
+    for required_key in _REQUIRED_HEADER_KEYS:
+        if required_key not in decoded_keys:
+            problems.append((2, f'Missing required header key {required_key}.'))
+    if len(header_keys) != len(header_values):
+        problems.append((3, f'File header keys count ({len(header_keys)}) is not equal to file header '
+                            f'data count ({len(header_values)}).'))
+    else:
+        for key, value in zip(decoded_keys, header_values):
+            try:
+                value = _HEADER_TYPE_MAP.get(key, float)(value.decode(errors='replace'))
+            except ValueError:
+                problems.append((3, f'Invalid value for header key {key}.'))
+                continue
+
+            if key == 'NumFrames':
+                num_frames = value
+            elif key == 'NumMarkers':
+                num_markers = value
+
+    data_header_markers = header_lines[3].split()
+    if len(data_header_markers) < 1 or data_header_markers[0] != b'Frame#':
+        problems.append((4, 'Data header does not start with "Frame#".'))
+    if len(data_header_markers) < 2 or data_header_markers[1] != b'Time':
+        problems.append((4, 'Data header in position 2 is not "Time".'))
+
+    sub_marker_headers = header_lines[4].split()
+    expected_entries = None
+    if num_markers is not None and data_format_count is not None:
+        expected_entries = num_markers * data_format_count
+        if expected_entries != len(sub_marker_headers):
+            problems.append((5, f'Data header sub-marker count ({len(sub_marker_headers)}) is not equal to '
+                                f'the expected count ({expected_entries}).'))
+
+    return num_frames, expected_entries, data_format_count
+
+
+def validate(filename):
+    """
+    Validate the structure of a trc motion capture data file without loading it.
+    The file is checked line by line as bytes, coordinate values are not converted.  Rather than
+    stopping at the first problem, all problems found are collected.  Checks made are the header
+    line counts, the required header keys, the 'Frame#' and 'Time' data header, the sub-marker count
+    against 'NumMarkers', the data line widths, that frame numbers increase and the number of frames
+    against 'NumFrames'.
+
+    :param filename: The name of the file to validate.
+    :return: A list of (line number, message) tuples describing the problems found, empty when the file is valid.
+    """
+    problems = []
+    with open(filename, 'rb') as f:
+        header_lines = list(itertools.islice(f, 5))
+        if len(header_lines) < 5:
+            problems.append((len(header_lines) + 1, 'File ended unexpectedly during header parsing.'))
+            return problems
+
+        num_frames, expected_entries, data_format_count = _validate_header(header_lines, problems)
+
+        frame_count = 0
+        previous_frame = None
+        line_num = 5
+        for line_num, line in enumerate(f, start=6):
+            sections = line.split()
+            if len(sections) == 0:
+                continue
+
+            frame_count += 1
+            try:
+                frame = int(sections[0])
+            except ValueError:
+                problems.append((line_num, 'Invalid frame number.'))
+                frame = None
+
+            if frame is not None:
+                if previous_frame is not None and frame <= previous_frame:
+                    problems.append((line_num, f'Frame number {frame} does not follow frame number {previous_frame}.'))
+                previous_frame = frame
+
+            if len(sections) < 2:
+                problems.append((line_num, 'Missing time value.'))
+                continue
+            if not _NUMBER_BYTES_RE.fullmatch(sections[1]):
+                problems.append((line_num, 'Invalid time value.'))
+
+            entries = len(sections) - 2
+            if data_format_count is not None and entries % data_format_count != 0 and \
+                    (expected_entries is None or entries <= expected_entries):
+                problems.append((line_num, f'Data line has {entries} entries, which does not match the data format.'))
+
+    if frame_count == 0:
+        problems.append((line_num, 'File ended without specifying any data.'))
+    elif num_frames is not None and frame_count != num_frames:
+        problems.append((line_num, f'File has {frame_count} frames, expected {num_frames} frames.'))
+
+    return problems
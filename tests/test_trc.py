@@ -1,9 +1,12 @@
 import io
 import os
+import math
 import unittest
 from contextlib import redirect_stderr
 
-from trc import TRCData, TRCFormatError
+import numpy as np
+
+from trc import TRCData, TRCFormatError, load_many_async, validate
 
 try:
     from .data_store import TEST_DATA_01, TEST_DATA_02, TEST_DATA_03, TEST_DATA_04, \
@@ -122,6 +125,80 @@ class TestC3DImport(unittest.TestCase):
         self.assertEqual(8, len(data['Markers']))
 
 
+class TestAsyncLoad(unittest.IsolatedAsyncioTestCase):
+
+    async def test_load_async_file_01(self):
+        data_sync = TRCData()
+        data_sync.load(os.path.join(resource_path, 'test_file_01.trc'))
+
+        data = TRCData()
+        await data.load_async(os.path.join(resource_path, 'test_file_01.trc'))
+        self.assertEqual(data_sync, data)
+
+    async def test_load_async_file_03(self):
+        data_sync = TRCData()
+        data_sync.load(os.path.join(resource_path, 'test_file_03.trc'))
+
+        data = TRCData()
+        await data.load_async(os.path.join(resource_path, 'test_file_03.trc'), chunk_size=7)
+        self.assertEqual(466, data['NumFrames'])
+        self.assertEqual(data_sync['Frame#'], data['Frame#'])
+        self.assertEqual(data_sync[466], data[466])
+
+    async def test_iter_frames_async(self):
+        data = TRCData()
+        frames = []
+        async for frame, (time, marker_list) in data.iter_frames_async(
+                os.path.join(resource_path, 'test_file_02.trc'), chunk_size=100):
+            frames.append(frame)
+            self.assertEqual(37, len(marker_list))
+        self.assertEqual(936, len(frames))
+        self.assertEqual(frames, data['Frame#'])
+
+    async def test_iter_frames_async_cancelled(self):
+        data = TRCData()
+        async for frame, _ in data.iter_frames_async(os.path.join(resource_path, 'test_file_02.trc'), chunk_size=10):
+            break
+        self.assertEqual(10, len(data['Frame#']))
+
+    async def test_load_async_invalid_chunk_size(self):
+        data = TRCData()
+        with self.assertRaises(ValueError):
+            await data.load_async(os.path.join(resource_path, 'test_file_01.trc'), chunk_size=0)
+        self.assertNotIn('NumFrames', data)
+
+    async def test_load_async_invalid(self):
+        input_file = os.path.join(resource_path, 'test_data_02_in.trc')
+        with open(input_file, 'w') as f:
+            f.write(TEST_DATA_02)
+
+        data = TRCData()
+        with self.assertRaises(TRCFormatError):
+            await data.load_async(input_file)
+
+        os.remove(input_file)
+
+    async def test_import_from_async(self):
+        data = TRCData()
+        await data.import_from_async(os.path.join(resource_path, 'c3d_test_file_02.c3d'))
+        self.assertEqual(100, data['NumFrames'])
+        self.assertEqual(75, len(data['Markers']))
+
+    async def test_load_many_async(self):
+        filenames = [os.path.join(resource_path, name) for name in
+                     ['test_file_01.trc', 'c3d_test_file_01.c3d', 'test_file_02.trc']]
+        data = await load_many_async(filenames, max_concurrency=1)
+        self.assertEqual([4, 8, 936], [d['NumFrames'] for d in data])
+
+    async def test_load_many_async_kwargs(self):
+        filenames = [os.path.join(resource_path, name) for name in
+                     ['test_file_01.trc', 'c3d_test_file_01.c3d']]
+        data = await load_many_async(filenames, load_kwargs={'chunk_size': 2, 'verbose': True},
+                                     import_kwargs={'filter_output': []})
+        self.assertEqual([4, 8], [d['NumFrames'] for d in data])
+        self.assertEqual(4, len(data[0]['Frame#']))
+
+
 class TestTRCData(unittest.TestCase):
 
     def test_parse_data_01(self):
@@ -221,6 +298,453 @@ class TestTRCData(unittest.TestCase):
             data.parse(TEST_DATA_16)
 
 
+class TestMapChunks(unittest.TestCase):
+
+    def test_map_chunks(self):
+        data = TRCData()
+        results = data.map_chunks(os.path.join(resource_path, 'test_file_02.trc'),
+                                  lambda frames, times, coordinates, core: frames[core].tolist(), chunk_size=100)
+        self.assertEqual(10, len(results))
+        self.assertEqual(36, len(results[-1]))
+        self.assertEqual(936, data['NumFrames'])
+        self.assertEqual([], data['Frame#'])
+
+        data_full = TRCData()
+        data_full.load(os.path.join(resource_path, 'test_file_02.trc'))
+        self.assertEqual(data_full['Frame#'], [frame for result in results for frame in result])
+
+    def test_map_chunks_reduce(self):
+        data = TRCData()
+
+        def _count_missing(frames, times, coordinates, core):
+            return int(sum(sum(sum(1 for v in values if math.isnan(v)) for values in line_data)
+                           for line_data in coordinates[core].tolist()))
+
+        missing = data.map_chunks(os.path.join(resource_path, 'test_file_05.trc'), _count_missing,
+                                  chunk_size=3, reduce=lambda a, b: a + b)
+        self.assertEqual(4 * 12, missing)
+
+        missing = data.map_chunks(os.path.join(resource_path, 'test_file_05.trc'), _count_missing,
+                                  chunk_size=3, reduce=lambda a, b: a + b, initial=10)
+        self.assertEqual(10 + 4 * 12, missing)
+
+    def test_map_chunks_overlap(self):
+        data = TRCData()
+        chunks = data.map_chunks(os.path.join(resource_path, 'test_file_02.trc'),
+                                 lambda frames, times, coordinates, core: (frames.tolist(), core),
+                                 chunk_size=400, overlap=5)
+        self.assertEqual(3, len(chunks))
+        frames, core = chunks[0]
+        self.assertEqual(405, len(frames))
+        self.assertEqual(slice(0, 400), core)
+        frames, core = chunks[1]
+        self.assertEqual(410, len(frames))
+        self.assertEqual(slice(5, 405), core)
+        frames, core = chunks[2]
+        self.assertEqual(141, len(frames))
+        self.assertEqual(slice(5, 141), core)
+
+    def test_map_chunks_output(self):
+        output_file = os.path.join(resource_path, 'test_file_02_chunked_out.trc')
+        data = TRCData()
+        result = data.map_chunks(os.path.join(resource_path, 'test_file_02.trc'),
+                                 lambda frames, times, coordinates, core: coordinates[core] / 1000.0,
+                                 chunk_size=250, output=output_file)
+        self.assertIsNone(result)
+
+        data_orig = TRCData()
+        data_orig.load(os.path.join(resource_path, 'test_file_02.trc'))
+        data_copy = TRCData()
+        data_copy.load(output_file)
+        self.assertEqual(data_orig['FileName'], data_copy['FileName'])
+        self.assertEqual(data_orig['Frame#'], data_copy['Frame#'])
+        self.assertEqual(data_orig['Markers'], data_copy['Markers'])
+        self.assertAlmostEqual(data_orig[500][1][3][1] / 1000.0, data_copy[500][1][3][1], places=5)
+
+        os.remove(output_file)
+
+    def test_map_chunks_output_invalid_shape(self):
+        output_file = os.path.join(resource_path, 'test_file_01_chunked_out.trc')
+        data = TRCData()
+        with self.assertRaises(ValueError):
+            data.map_chunks(os.path.join(resource_path, 'test_file_01.trc'),
+                            lambda frames, times, coordinates, core: coordinates[core][:1, :1],
+                            output=output_file)
+
+        os.remove(output_file)
+
+    def test_map_chunks_invalid_frame(self):
+        input_file = os.path.join(resource_path, 'test_file_02_bad_frame_in.trc')
+        with open(os.path.join(resource_path, 'test_file_02.trc')) as f:
+            lines = f.readlines()
+        lines[500] = 'x' + lines[500]
+        with open(input_file, 'w') as f:
+            f.writelines(lines)
+
+        data = TRCData()
+        with self.assertRaises(TRCFormatError) as cm:
+            data.map_chunks(input_file, lambda frames, times, coordinates, core: None, chunk_size=100)
+        self.assertIn('line 501', str(cm.exception))
+
+        os.remove(input_file)
+
+    def test_map_chunks_invalid_arguments(self):
+        data = TRCData()
+        filename = os.path.join(resource_path, 'test_file_01.trc')
+        with self.assertRaises(ValueError):
+            data.map_chunks(filename, lambda frames, times, coordinates, core: None, chunk_size=0)
+        with self.assertRaises(ValueError):
+            data.map_chunks(filename, lambda frames, times, coordinates, core: None, overlap=-1)
+
+
+class TestCombineTrials(unittest.TestCase):
+
+    def test_concat(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        combined = TRCData.concat([data, data, data])
+        self.assertEqual(12, combined['NumFrames'])
+        self.assertEqual(2, combined['NumMarkers'])
+        self.assertEqual(list(range(1, 13)), combined['Frame#'])
+        self.assertEqual(data[2][1], combined[6][1])
+        self.assertAlmostEqual(11 / 60.0, combined[12][0])
+        self.assertEqual(12, len(combined['HeadTop']))
+        self.assertEqual(data['ForeHead'][3], combined['ForeHead'][11])
+        self.assertEqual(data['Units'], combined['Units'])
+
+    def test_concat_reordered_markers(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        reordered = TRCData()
+        reordered.parse(TEST_DATA_01)
+        reordered['Markers'] = ['ForeHead', 'HeadTop']
+        for frame in reordered['Frame#']:
+            time, line_data = reordered[frame]
+            reordered[frame] = (time, line_data[::-1])
+
+        combined = TRCData.concat([data, reordered])
+        self.assertEqual(data[1][1], combined[5][1])
+
+    def test_concat_save(self):
+        output_file = os.path.join(resource_path, 'c3d_test_file_01_concat_out.trc')
+        data = TRCData()
+        data.import_from(os.path.join(resource_path, 'c3d_test_file_01.c3d'))
+        combined = TRCData.concat([data, data])
+        combined.save(output_file)
+
+        data_copy = TRCData()
+        data_copy.load(output_file)
+        self.assertEqual(16, data_copy['NumFrames'])
+        self.assertEqual(16, len(data_copy['Frame#']))
+        self.assertEqual(data['Markers'], data_copy['Markers'])
+
+        os.remove(output_file)
+
+    def test_concat_invalid(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        other = TRCData()
+        other.parse(TEST_DATA_01)
+        other['Units'] = 'm'
+        with self.assertRaises(ValueError):
+            TRCData.concat([data, other])
+        other['Units'] = 'mm'
+        other['DataRate'] = 120.0
+        with self.assertRaises(ValueError):
+            TRCData.concat([data, other])
+        different_markers = TRCData()
+        different_markers.parse(TEST_DATA_10)
+        with self.assertRaises(ValueError):
+            TRCData.concat([data, different_markers])
+        with self.assertRaises(ValueError):
+            TRCData.concat([])
+
+    def test_merge(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        other = TRCData()
+        other.parse(TEST_DATA_01.replace('HeadTop', 'Chin').replace('ForeHead', 'Neck'))
+        for on in ['Time', 'Frame#']:
+            merged = data.merge(other, on=on)
+            self.assertEqual(4, merged['NumFrames'])
+            self.assertEqual(4, merged['NumMarkers'])
+            self.assertEqual(['HeadTop', 'ForeHead', 'Chin', 'Neck'], merged['Markers'])
+            self.assertEqual(data['HeadTop'], merged['HeadTop'])
+            self.assertEqual(data['ForeHead'], merged['Neck'])
+            self.assertEqual(data[3][1] + data[3][1], merged[3][1])
+
+    def test_merge_partial_overlap(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        longer = TRCData.concat([data, data])
+        other = TRCData()
+        other.parse(TEST_DATA_01.replace('HeadTop', 'Chin').replace('ForeHead', 'Neck'))
+        merged = longer.merge(other)
+        self.assertEqual([1, 2, 3, 4], merged['Frame#'])
+        self.assertEqual(4, len(merged['Chin']))
+
+    def test_merge_duplicate_keys(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        other = TRCData()
+        other.parse(TEST_DATA_01.replace('HeadTop', 'Chin').replace('ForeHead', 'Neck').replace('0.033', '0.020'))
+        with self.assertRaises(ValueError) as cm:
+            data.merge(other, on='Time')
+        self.assertIn('Duplicate Time', str(cm.exception))
+
+        other = TRCData()
+        other.parse(TEST_DATA_01.replace('HeadTop', 'Chin').replace('ForeHead', 'Neck').replace('\n3\t', '\n2\t'))
+        with self.assertRaises(ValueError) as cm:
+            data.merge(other, on='Frame#')
+        self.assertIn('Duplicate Frame# values', str(cm.exception))
+        self.assertIn('[2]', str(cm.exception))
+
+    def test_merge_invalid(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        with self.assertRaises(ValueError):
+            data.merge(data)
+        other = TRCData()
+        other.parse(TEST_DATA_01.replace('HeadTop', 'Chin').replace('ForeHead', 'Neck'))
+        with self.assertRaises(ValueError):
+            data.merge(other, on='Frame')
+        other['DataRate'] = 30.0
+        with self.assertRaises(ValueError):
+            data.merge(other)
+
+
+class TestCoordinateTransforms(unittest.TestCase):
+
+    def test_convert_units(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        head_top = data['HeadTop']
+        data.convert_units('m')
+        self.assertEqual('m', data['Units'])
+        self.assertAlmostEqual(-2.8941709, data[1][1][0][0])
+        self.assertIs(head_top[0], data[1][1][0])
+
+        data.convert_units('mm')
+        self.assertEqual('mm', data['Units'])
+        self.assertAlmostEqual(1663.1084, data['HeadTop'][0][1])
+
+    def test_convert_units_missing_data(self):
+        data = TRCData()
+        data.load(os.path.join(resource_path, 'test_file_05.trc'))
+        data.convert_units('cm')
+        self.assertAlmostEqual(24.004201, data['PEL_MO'][0][0])
+        self.assertTrue(math.isnan(data['HED_MP'][0][0]))
+
+    def test_convert_units_invalid(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        with self.assertRaises(ValueError):
+            data.convert_units('in')
+
+    def test_transform(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        data.transform(rotation=[[0, -1, 0], [1, 0, 0], [0, 0, 1]], translation=[10.0, 20.0, 30.0])
+        self.assertAlmostEqual(-1663.1084 + 10.0, data[1][1][0][0])
+        self.assertAlmostEqual(-2894.1709 + 20.0, data[1][1][0][1])
+        self.assertAlmostEqual(-3255.51221 + 30.0, data['HeadTop'][0][2])
+
+    def test_transform_rounded_rotation(self):
+        # Rz(20 degrees) @ Rx(30 degrees) written to six decimal places.
+        rotation = [
+            [0.939693, -0.296198, 0.171010],
+            [0.342020, 0.813798, -0.469846],
+            [0.0, 0.5, 0.866025],
+        ]
+        x, y, z = [-2894.1709, 1663.1084, -3255.51221]
+        for matrix in [rotation, np.array(rotation, dtype=np.float32)]:
+            data = TRCData()
+            data.parse(TEST_DATA_01)
+            data.transform(rotation=matrix)
+            self.assertAlmostEqual(0.5 * y + 0.866025 * z, data['HeadTop'][0][2], places=2)
+
+    def test_transform_invalid(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        with self.assertRaises(ValueError):
+            data.transform(rotation=[[1, 0], [0, 1]])
+        with self.assertRaises(ValueError):
+            data.transform(translation=[1.0, 2.0])
+        with self.assertRaises(ValueError) as cm:
+            data.transform(rotation=[[2, 0, 0], [0, 2, 0], [0, 0, 2]])
+        self.assertNotIn('mirror', str(cm.exception))
+        with self.assertRaises(ValueError) as cm:
+            data.transform(rotation=[[-1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        self.assertIn('mirror', str(cm.exception))
+        self.assertEqual([-2894.1709, 1663.1084, -3255.51221], data['HeadTop'][0])
+
+    def test_z_up_to_y_up(self):
+        data = TRCData()
+        data.import_from(os.path.join(resource_path, 'c3d_test_file_03.c3d'))
+        frame = data['Frame#'][0]
+        original = [list(values) for values in data[frame][1]]
+        data.z_up_to_y_up()
+        x, y, z = original[0]
+        self.assertEqual([x, z, -y], data[frame][1][0])
+        self.assertTrue(all(math.isnan(v) for v in data[frame][1][-1]))
+
+    def test_mirror(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        data.mirror('Y')
+        self.assertEqual([-2894.1709, -1663.1084, -3255.51221], data['HeadTop'][0])
+        with self.assertRaises(ValueError):
+            data.mirror('W')
+
+
+class TestKinematics(unittest.TestCase):
+
+    def test_velocities(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        velocities = data.velocities()
+        self.assertEqual((4, 2, 3), velocities.shape)
+
+        head_top = data['HeadTop']
+        expected = (head_top[2][0] - head_top[0][0]) * 60.0 / 2
+        self.assertAlmostEqual(expected, velocities[1, 0, 0])
+        expected = (head_top[3][2] - head_top[2][2]) * 60.0
+        self.assertAlmostEqual(expected, velocities[3, 0, 2])
+
+    def test_velocities_use_time(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        velocities = data.velocities(use_time=True)
+
+        fore_head = data['ForeHead']
+        expected = (fore_head[1][1] - fore_head[0][1]) / 0.017
+        self.assertAlmostEqual(expected, velocities[0, 1, 1])
+
+    def test_accelerations(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        accelerations = data.accelerations()
+        self.assertEqual((4, 2, 3), accelerations.shape)
+
+        velocities = data.velocities()
+        expected = (velocities[3, 1, 0] - velocities[1, 1, 0]) * 60.0 / 2
+        self.assertAlmostEqual(expected, accelerations[2, 1, 0])
+
+    def test_velocities_single_frame(self):
+        data = TRCData()
+        data.parse(TEST_DATA_10)
+        data['Frame#'] = data['Frame#'][:1]
+        with self.assertRaises(ValueError):
+            data.velocities()
+
+    def test_velocities_missing_data(self):
+        data = TRCData()
+        data.load(os.path.join(resource_path, 'test_file_05.trc'))
+        velocities = data.velocities()
+        self.assertFalse(math.isnan(velocities[0, 0, 0]))
+        self.assertTrue(math.isnan(velocities[0, 7, 0]))
+
+    def test_marker_distances(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        distances = data.marker_distances()
+        self.assertEqual([('HeadTop', 'ForeHead')], list(distances.keys()))
+
+        expected = math.dist(data['HeadTop'][2], data['ForeHead'][2])
+        self.assertAlmostEqual(expected, distances[('HeadTop', 'ForeHead')][2])
+
+    def test_marker_distances_missing_data(self):
+        data = TRCData()
+        data.load(os.path.join(resource_path, 'test_file_05.trc'))
+        distances = data.marker_distances([('PEL_MO', 'PEL_MA'), ('PEL_MO', 'HED_MP')])
+        self.assertEqual(2, len(distances))
+        self.assertEqual(4, len(distances[('PEL_MO', 'PEL_MA')]))
+        self.assertFalse(any(math.isnan(v) for v in distances[('PEL_MO', 'PEL_MA')]))
+        self.assertTrue(all(math.isnan(v) for v in distances[('PEL_MO', 'HED_MP')]))
+
+    def test_marker_distances_generator(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        distances = data.marker_distances(pair for pair in [('HeadTop', 'ForeHead')])
+        self.assertEqual([('HeadTop', 'ForeHead')], list(distances.keys()))
+        lengths = data.segment_lengths(pair for pair in [('HeadTop', 'ForeHead')])
+        self.assertEqual([('HeadTop', 'ForeHead')], list(lengths.keys()))
+
+    def test_marker_distances_unknown_marker(self):
+        data = TRCData()
+        data.parse(TEST_DATA_01)
+        with self.assertRaises(KeyError):
+            data.marker_distances([('HeadTop', 'Chin')])
+
+    def test_segment_lengths(self):
+        data = TRCData()
+        data.load(os.path.join(resource_path, 'test_file_05.trc'))
+        lengths = data.segment_lengths([('PEL_MO', 'PEL_MA'), ('PEL_MO', 'HED_MP')])
+
+        expected = sum(math.dist(a, b) for a, b in zip(data['PEL_MO'], data['PEL_MA'])) / 4
+        self.assertAlmostEqual(expected, lengths[('PEL_MO', 'PEL_MA')])
+        self.assertTrue(math.isnan(lengths[('PEL_MO', 'HED_MP')]))
+
+    def test_c3d_velocities(self):
+        data = TRCData()
+        data.import_from(os.path.join(resource_path, 'c3d_test_file_02.c3d'))
+        self.assertEqual((100, 75, 3), data.velocities().shape)
+
+
+class TestValidate(unittest.TestCase):
+
+    def _validate_data(self, data):
+        input_file = os.path.join(resource_path, 'validate_in.trc')
+        with open(input_file, 'w') as f:
+            f.write(data)
+        problems = validate(input_file)
+        os.remove(input_file)
+        return problems
+
+    def test_validate_files(self):
+        for filename in ['test_file_01.trc', 'test_file_02.trc', 'test_file_03.trc', 'test_file_04.trc',
+                         'test_file_05.trc', 'test_file_06_2tab_one_space.trc']:
+            self.assertEqual([], validate(os.path.join(resource_path, filename)))
+
+    def test_validate_valid_data(self):
+        for data in [TEST_DATA_01, TEST_DATA_08, TEST_DATA_10, TEST_DATA_12]:
+            self.assertEqual([], self._validate_data(data))
+
+    def test_validate_invalid_data(self):
+        expected_line_numbers = [
+            (TEST_DATA_02, 1), (TEST_DATA_03, 3), (TEST_DATA_04, 4), (TEST_DATA_05, 4), (TEST_DATA_06, 5),
+            (TEST_DATA_07, 9), (TEST_DATA_09, 10), (TEST_DATA_13, 5), (TEST_DATA_14, 3), (TEST_DATA_15, 7),
+            (TEST_DATA_16, 7),
+        ]
+        for data, line_number in expected_line_numbers:
+            problems = self._validate_data(data)
+            self.assertEqual(1, len(problems))
+            self.assertEqual(line_number, problems[0][0])
+
+    def test_validate_missing_header_keys(self):
+        lines = TEST_DATA_01.split('\n')
+        lines[1] = lines[1].replace('NumFrames\tNumMarkers\t', '')
+        lines[2] = lines[2].replace('       4\t2\t', '')
+        problems = self._validate_data('\n'.join(lines))
+        self.assertEqual([
+            (2, 'Missing required header key NumFrames.'),
+            (2, 'Missing required header key NumMarkers.'),
+        ], problems)
+
+    def test_validate_collects_problems(self):
+        lines = TEST_DATA_01.split('\n')
+        lines[8] = lines[8].replace('3\t0.033', '1\t0.033')
+        lines[9] = lines[9].replace('0.050', '0.05O')
+        lines.append(lines[7].replace('2\t0.017', '5\t0.067').rsplit('\t', 1)[0])
+        problems = self._validate_data('\n'.join(lines))
+        self.assertEqual([
+            (9, 'Frame number 1 does not follow frame number 2.'),
+            (10, 'Invalid time value.'),
+            (11, 'Data line has 5 entries, which does not match the data format.'),
+            (11, 'File has 5 frames, expected 4 frames.'),
+        ], problems)
+
+
 class TestStoreTRC(unittest.TestCase):
 
     def test_save_file_01(self):